@@ -7,8 +7,10 @@ This module is called at application startup to register all AURORA actions.
 AURORA manages user pre-registration and invitation workflows.
 """
 
+import functools
 import logging
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +18,7 @@ logger = logging.getLogger(__name__)
 # Each action follows the format: module.resource.operation
 # Translation keys follow ECHOES convention: {module}.actions.{resource}.{operation}.name/description
 
-AURORA_ACTIONS: List[Dict[str, Any]] = [
+_RAW_ACTIONS: List[Dict[str, Any]] = [
     # View invitations - view invitation list and details
     {
         "resource": "invitations",
@@ -40,43 +42,76 @@ AURORA_ACTIONS: List[Dict[str, Any]] = [
     },
 ]
 
+# Frozen at import: the definitions are constants, so expose immutable
+# views (tuple of mapping proxies) that can be shared without per-call
+# copies or defensive .copy() loops
+AURORA_ACTIONS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({**action, "valid_scopes": tuple(action["valid_scopes"])})
+    for action in _RAW_ACTIONS
+)
+
+# Precomputed action codes (e.g. 'aurora.invitations.view')
+AURORA_ACTION_CODES: Tuple[str, ...] = tuple(
+    f"aurora.{action['resource']}.{action['operation']}"
+    for action in AURORA_ACTIONS
+)
+
+
+# Successful registration result, cached so repeated startup hooks
+# (lifespan re-entry, code reloads) skip the registry round-trip
+_registered: Optional[list] = None
+
+
+@functools.cache
+def _actions_with_scopes() -> List[Dict[str, Any]]:
+    """Convert valid_scopes strings to ActionScope enums, once per process.
+
+    The MENTOR import is deferred to avoid circular dependencies, and the
+    converted list is cached so subsequent registrations reuse it.
+    """
+    from src.modules.mentor import ActionScope
+
+    return [
+        {
+            **action,
+            "valid_scopes": tuple(ActionScope(s) for s in action["valid_scopes"]),
+        }
+        for action in AURORA_ACTIONS
+    ]
+
 
 def register_aurora_actions():
     """
     Register all AURORA actions with the MENTOR Action Registry.
 
     This function should be called at application startup. It safely imports
-    from MENTOR to avoid circular dependencies.
+    from MENTOR to avoid circular dependencies. Registration is idempotent
+    per process: after the first success the cached result is returned
+    without touching the registry again.
 
     Returns:
         List of registered actions, or empty list if registration failed
     """
+    global _registered
+
+    if _registered is not None:
+        return _registered
+
     try:
         # Import from MENTOR to access the action registry
         # This import is done here to avoid circular dependencies
-        from src.modules.mentor import (
-            get_action_registry,
-            ActionScope,
-        )
+        from src.modules.mentor import get_action_registry
 
         registry = get_action_registry()
 
-        # Convert scope strings to ActionScope enums
-        actions_with_scopes = []
-        for action in AURORA_ACTIONS:
-            action_copy = action.copy()
-            action_copy["valid_scopes"] = [
-                ActionScope(s) for s in action["valid_scopes"]
-            ]
-            actions_with_scopes.append(action_copy)
-
         registered = registry.register_module_actions(
             module="aurora",
-            actions=actions_with_scopes,
+            actions=_actions_with_scopes(),
             default_category="aurora",
         )
 
         logger.info(f"Registered {len(registered)} AURORA actions with MENTOR")
+        _registered = registered
         return registered
 
     except ImportError as e:
@@ -99,7 +134,4 @@ def get_aurora_action_codes() -> List[str]:
     Returns:
         List of action codes (e.g., ['aurora.invitations.view', 'aurora.invitations.create'])
     """
-    return [
-        f"aurora.{action['resource']}.{action['operation']}"
-        for action in AURORA_ACTIONS
-    ]
+    return list(AURORA_ACTION_CODES)
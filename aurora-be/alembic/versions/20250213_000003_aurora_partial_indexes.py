@@ -0,0 +1,75 @@
+"""Replace tenant listing indexes with live-row partial indexes
+
+Revision ID: 20250213_000003
+Revises: 20250213_000002
+Create Date: 2025-02-13
+
+Every Aurora query filters deleted_at IS NULL, but the tenant listing
+indexes also covered soft-deleted rows, so Postgres re-checked the
+predicate per tuple. Partial indexes keep only live rows: smaller
+b-trees, fewer heap fetches per page.
+
+Dependencies: Aurora invitations table (20250213_000002)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250213_000003'
+down_revision: Union[str, None] = '20250213_000002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # PARTIAL INDEXES: Live rows only (deleted_at IS NULL)
+    # ============================================================================
+
+    # Tenant listing (list_invitations order by created_at DESC)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_tenant_live_created
+        ON aurora_invitations(tenant_id, created_at DESC)
+        WHERE deleted_at IS NULL
+    """)
+
+    # Tenant + status queries (filters, stats)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_tenant_live_status
+        ON aurora_invitations(tenant_id, status)
+        WHERE deleted_at IS NULL
+    """)
+
+    # Hot "pending inbox" scans
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_tenant_pending_created
+        ON aurora_invitations(tenant_id, created_at DESC)
+        WHERE status = 'PENDING' AND deleted_at IS NULL
+    """)
+
+    # ============================================================================
+    # DROP SUPERSEDED FULL INDEXES
+    # ============================================================================
+    # All query paths filter on deleted_at IS NULL, so the full-table
+    # variants only cost write amplification.
+    op.execute("DROP INDEX IF EXISTS idx_aurora_tenant_created")
+    op.execute("DROP INDEX IF EXISTS idx_aurora_tenant_status")
+
+
+def downgrade() -> None:
+    # Restore the original full indexes
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_tenant_status
+        ON aurora_invitations(tenant_id, status)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_tenant_created
+        ON aurora_invitations(tenant_id, created_at DESC)
+    """)
+
+    # Drop the partial indexes
+    op.execute("DROP INDEX IF EXISTS idx_aurora_tenant_pending_created")
+    op.execute("DROP INDEX IF EXISTS idx_aurora_tenant_live_status")
+    op.execute("DROP INDEX IF EXISTS idx_aurora_tenant_live_created")
@@ -0,0 +1,67 @@
+"""Consolidate the token_hash indexes into one tuned unique index
+
+Revision ID: 20250213_000004
+Revises: 20250213_000003
+Create Date: 2025-02-13
+
+token_hash carried both a column UNIQUE constraint and a separate
+explicit index — two b-trees maintained on every insert for one lookup
+path. Collapse them into a single unique index with fillfactor=90
+(invitation rows are rarely updated after creation, so denser pages are
+safe). No INCLUDE clause: the accept path reads and returns whole rows,
+so an index-only scan can never apply, and carrying the unbounded UUID
+array columns in index tuples could overflow the b-tree row-size limit.
+
+Dependencies: Aurora partial indexes (20250213_000003)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250213_000004'
+down_revision: Union[str, None] = '20250213_000003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # CONSOLIDATED UNIQUE TOKEN INDEX
+    # ============================================================================
+    # fillfactor=90 since invitation rows are rarely updated after creation
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_aurora_token_hash_cov
+        ON aurora_invitations(token_hash)
+        WITH (fillfactor = 90)
+    """)
+
+    # ============================================================================
+    # DROP SUPERSEDED TOKEN INDEXES
+    # ============================================================================
+    # The explicit non-unique index and the column's UNIQUE constraint both
+    # duplicate the new index; uniqueness is now enforced by it.
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_hash")
+    op.execute("""
+        ALTER TABLE aurora_invitations
+        DROP CONSTRAINT IF EXISTS aurora_invitations_token_hash_key
+    """)
+
+    # Refresh statistics so the planner picks the new index
+    op.execute("ANALYZE aurora_invitations")
+
+
+def downgrade() -> None:
+    # Restore the original unique constraint and explicit index
+    op.execute("""
+        ALTER TABLE aurora_invitations
+        ADD CONSTRAINT aurora_invitations_token_hash_key UNIQUE (token_hash)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_token_hash
+        ON aurora_invitations(token_hash)
+    """)
+
+    # Drop the consolidated index
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_hash_cov")
@@ -0,0 +1,63 @@
+"""Store token_hash as raw 32-byte BYTEA instead of hex text
+
+Revision ID: 20250213_000005
+Revises: 20250213_000004
+Create Date: 2025-02-13
+
+A hex-encoded SHA-256 occupies 64 bytes per key; the raw digest is 32.
+Halving the key width roughly doubles b-tree fan-out on the token index,
+reducing index depth and I/O on the acceptance lookup.
+
+Dependencies: Aurora token covering index (20250213_000004)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250213_000005'
+down_revision: Union[str, None] = '20250213_000004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # CONVERT token_hash: VARCHAR(64) hex -> BYTEA raw digest
+    # ============================================================================
+    op.execute("ALTER TABLE aurora_invitations ADD COLUMN token_hash_bin BYTEA")
+    op.execute("UPDATE aurora_invitations SET token_hash_bin = decode(token_hash, 'hex')")
+    op.execute("ALTER TABLE aurora_invitations ALTER COLUMN token_hash_bin SET NOT NULL")
+
+    # Rebuild the unique token index on the binary column
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_hash_cov")
+    op.execute("ALTER TABLE aurora_invitations DROP COLUMN token_hash")
+    op.execute("ALTER TABLE aurora_invitations RENAME COLUMN token_hash_bin TO token_hash")
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_aurora_token_hash_cov
+        ON aurora_invitations(token_hash)
+        WITH (fillfactor = 90)
+    """)
+
+    op.execute("COMMENT ON COLUMN aurora_invitations.token_hash IS 'SHA-256 digest of acceptance token (32 raw bytes)'")
+    op.execute("ANALYZE aurora_invitations")
+
+
+def downgrade() -> None:
+    # Convert back to hex text
+    op.execute("ALTER TABLE aurora_invitations ADD COLUMN token_hash_hex VARCHAR(64)")
+    op.execute("UPDATE aurora_invitations SET token_hash_hex = encode(token_hash, 'hex')")
+    op.execute("ALTER TABLE aurora_invitations ALTER COLUMN token_hash_hex SET NOT NULL")
+
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_hash_cov")
+    op.execute("ALTER TABLE aurora_invitations DROP COLUMN token_hash")
+    op.execute("ALTER TABLE aurora_invitations RENAME COLUMN token_hash_hex TO token_hash")
+    op.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_aurora_token_hash_cov
+        ON aurora_invitations(token_hash)
+        WITH (fillfactor = 90)
+    """)
+
+    op.execute("COMMENT ON COLUMN aurora_invitations.token_hash IS 'SHA-256 hash of acceptance token'")
+    op.execute("ANALYZE aurora_invitations")
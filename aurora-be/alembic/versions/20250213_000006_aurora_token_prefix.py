@@ -0,0 +1,45 @@
+"""Add token_prefix column for cheap pre-hash token lookups
+
+Revision ID: 20250213_000006
+Revises: 20250213_000005
+Create Date: 2025-02-13
+
+Storing the first 8 characters of the raw token lets get_by_token probe
+a narrow index before computing any digest: a prefix miss rejects
+malformed or unknown tokens without hashing, and a hit leaves a single
+candidate whose hash is then verified. Existing rows keep a NULL prefix
+(their raw tokens are unrecoverable from the digest) and continue to
+resolve through the token_hash index; prefixes fill in as tokens rotate
+on resend.
+
+Dependencies: Aurora token_hash as BYTEA (20250213_000005)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250213_000006'
+down_revision: Union[str, None] = '20250213_000005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ============================================================================
+    # ADD token_prefix: first 8 chars of the raw token, indexed
+    # ============================================================================
+    op.execute("ALTER TABLE aurora_invitations ADD COLUMN IF NOT EXISTS token_prefix VARCHAR(8)")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_token_prefix
+        ON aurora_invitations(token_prefix)
+    """)
+
+    op.execute("COMMENT ON COLUMN aurora_invitations.token_prefix IS 'First 8 chars of the raw token (narrows lookup before hashing; NULL on legacy rows)'")
+    op.execute("ANALYZE aurora_invitations")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_prefix")
+    op.execute("ALTER TABLE aurora_invitations DROP COLUMN IF EXISTS token_prefix")
@@ -0,0 +1,43 @@
+"""Restrict the token_prefix index to live rows
+
+Revision ID: 20250213_000007
+Revises: 20250213_000006
+Create Date: 2025-02-13
+
+get_by_token always filters on deleted_at IS NULL, so soft-deleted rows
+in the prefix index are dead weight: they bloat the b-tree without ever
+satisfying a probe. Rebuilding the index as a partial over live rows
+keeps it smaller and hotter in cache, same as the other Aurora partial
+indexes.
+
+Dependencies: Aurora token_prefix column (20250213_000006)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250213_000007'
+down_revision: Union[str, None] = '20250213_000006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_prefix")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_token_prefix
+        ON aurora_invitations(token_prefix)
+        WHERE deleted_at IS NULL
+    """)
+    op.execute("ANALYZE aurora_invitations")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_aurora_token_prefix")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_aurora_token_prefix
+        ON aurora_invitations(token_prefix)
+    """)
+    op.execute("ANALYZE aurora_invitations")
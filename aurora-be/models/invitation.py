@@ -3,9 +3,9 @@
 import enum
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, Index, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Enum, Index, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -13,6 +13,8 @@ from sqlalchemy.sql import func
 # Use Matrix infrastructure (Layer 0)
 from src.database import Base
 
+from .._fast_uuid import fast_uuid4
+
 
 class InvitationStatus(str, enum.Enum):
     """Invitation status states"""
@@ -30,7 +32,7 @@ class Invitation(Base):
 
     # Primary key
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4
+        PGUUID(as_uuid=True), primary_key=True, default=fast_uuid4
     )
 
     # Invitee info
@@ -46,7 +48,9 @@ class Invitation(Base):
         comment="Invitee display name (optional)",
     )
 
-    # Context
+    # Context. Assignment targets are plain UUID arrays, not ORM
+    # relationships: Mentor owns the client/role-group tables, and the
+    # ids travel inside the row itself, so reads can never N+1 on them
     tenant_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
         nullable=False,
@@ -80,13 +84,20 @@ class Invitation(Base):
         comment="User who created the invitation",
     )
 
-    # Token for acceptance (hashed like Guardian tokens)
-    token_hash: Mapped[str] = mapped_column(
-        String(64),
+    # Token for acceptance (hashed like Guardian tokens). Stored as the
+    # raw 32-byte digest: half the key width of hex text, so the unique
+    # index gets double the fan-out
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         nullable=False,
         unique=True,
         index=True,
-        comment="SHA-256 hash of acceptance token",
+        comment="SHA-256 digest of acceptance token (32 raw bytes)",
+    )
+    token_prefix: Mapped[Optional[str]] = mapped_column(
+        String(8),
+        nullable=True,
+        comment="First 8 chars of the raw token (narrows lookup before hashing; NULL on legacy rows)",
     )
 
     # Timestamps
@@ -132,25 +143,44 @@ class Invitation(Base):
 
     # Table indexes and constraints
     __table_args__ = (
-        # Unique pending invitation per email per tenant
-        UniqueConstraint(
+        # Unique pending invitation per email per tenant — a partial
+        # unique index (migration 000002), which also arbitrates the
+        # ON CONFLICT in create()/bulk_create()
+        Index(
+            "idx_aurora_unique_pending",
             "tenant_id",
             "email",
-            name="uq_aurora_pending_invitation",
+            unique=True,
             postgresql_where="status = 'PENDING' AND deleted_at IS NULL",
         ),
-        # Tenant status queries
+        # Tenant status queries (live rows only)
         Index(
-            "idx_aurora_tenant_status",
+            "idx_aurora_tenant_live_status",
             "tenant_id",
             "status",
+            postgresql_where="deleted_at IS NULL",
+        ),
+        # Tenant created queries (live rows only)
+        Index(
+            "idx_aurora_tenant_live_created",
+            "tenant_id",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
+            postgresql_where="deleted_at IS NULL",
         ),
-        # Tenant created queries
+        # Token prefix probes (live rows only, matching get_by_token)
         Index(
-            "idx_aurora_tenant_created",
+            "idx_aurora_token_prefix",
+            "token_prefix",
+            postgresql_where="deleted_at IS NULL",
+        ),
+        # Hot pending-inbox scans
+        Index(
+            "idx_aurora_tenant_pending_created",
             "tenant_id",
             "created_at",
             postgresql_ops={"created_at": "DESC"},
+            postgresql_where="status = 'PENDING' AND deleted_at IS NULL",
         ),
     )
 
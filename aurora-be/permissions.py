@@ -0,0 +1,78 @@
+"""Aurora permission helpers - cached wrapper over Mentor's checks.
+
+Every Aurora endpoint depends on Mentor's require_permission, which
+resolves the grant against the database on each request. For chatty
+list/stats dashboards that lookup dominates response time, so this module
+caches confirmed grants per process with a short TTL.
+"""
+
+import time
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Use Matrix infrastructure (Layer 0)
+from src.database import get_db
+
+# Use Mentor dependencies (Layer 3) for auth and permissions
+from src.modules.mentor.dependencies.auth import CurrentUser
+from src.modules.mentor.dependencies.tenant import TenantContext
+from src.modules.mentor.dependencies.permissions import require_permission
+
+try:
+    # Mentor's callable check, usable outside the dependency graph
+    from src.modules.mentor.dependencies.permissions import check_permission
+except ImportError:
+    check_permission = None  # Older Mentor: no caching possible
+
+# (user_id, action, tenant_id) -> monotonic expiry of a confirmed grant.
+# Per uvicorn worker, so there is no cross-process coherence cost; the
+# short TTL bounds staleness after role-group changes. Denials are never
+# cached: a rejected request always re-checks.
+_PERM_CACHE: dict[tuple, float] = {}
+_PERM_CACHE_TTL = 30.0
+_PERM_CACHE_MAX = 100_000
+
+
+def invalidate_permission_cache() -> None:
+    """Drop all cached grants (call after role or permission changes)"""
+    _PERM_CACHE.clear()
+
+
+def require_permission_cached(action: str):
+    """require_permission with a per-process TTL cache on granted checks.
+
+    A cache hit turns the permission dependency into a dict lookup; a
+    miss delegates to Mentor's check_permission and caches the grant for
+    _PERM_CACHE_TTL seconds. When the deployed Mentor does not expose
+    check_permission, this degrades to the plain require_permission
+    dependency with no caching.
+    """
+    if check_permission is None:
+        return require_permission(action)
+
+    async def checker(
+        current_user: CurrentUser,
+        tenant: TenantContext,
+        db: Annotated[AsyncSession, Depends(get_db)],
+    ) -> None:
+        key = (current_user.id, action, tenant.tenant_id)
+        now = time.monotonic()
+        expires = _PERM_CACHE.get(key)
+        if expires is not None and expires > now:
+            return
+
+        # Raises (403) on denial, exactly like require_permission
+        await check_permission(
+            db,
+            user_id=current_user.id,
+            action=action,
+            tenant_id=tenant.tenant_id,
+        )
+
+        if len(_PERM_CACHE) >= _PERM_CACHE_MAX:
+            _PERM_CACHE.clear()
+        _PERM_CACHE[key] = now + _PERM_CACHE_TTL
+
+    return checker
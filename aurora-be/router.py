@@ -4,10 +4,17 @@ Aggregates all sub-routers under /v1/aurora prefix.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .routers.invitations import router as invitations_router
 
-router = APIRouter(prefix="/v1/aurora", tags=["aurora"])
+# orjson serializes UUID/datetime-heavy payloads (invitation pages) in a
+# single C pass, several times faster than the stdlib json encoder
+router = APIRouter(
+    prefix="/v1/aurora",
+    tags=["aurora"],
+    default_response_class=ORJSONResponse,
+)
 
 # Mount sub-routers
 router.include_router(invitations_router, prefix="/invitations", tags=["invitations"])
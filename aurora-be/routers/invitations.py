@@ -1,10 +1,12 @@
 """Invitation management API endpoints"""
 
+import asyncio
+import logging
 from datetime import datetime
-from typing import Annotated, Optional
+from typing import Annotated, Coroutine, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Use Matrix infrastructure (Layer 0)
@@ -13,9 +15,9 @@ from src.database import get_db
 # Use Mentor dependencies (Layer 3) for auth and permissions
 from src.modules.mentor.dependencies.auth import CurrentUser
 from src.modules.mentor.dependencies.tenant import TenantContext
-from src.modules.mentor.dependencies.permissions import require_permission
-
 from ..config import aurora_config
+from ..permissions import require_permission_cached
+from ..dependencies import InvitationServiceDep
 from ..models.invitation import InvitationStatus
 from ..schemas.invitation import (
     InvitationCreate,
@@ -28,10 +30,51 @@ from ..schemas.invitation import (
     InvitationRevokeResponse,
     InvitationStats,
 )
-from ..services.invitation_service import InvitationService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Strong references to in-flight fire-and-forget tasks, so the event
+# loop does not garbage-collect them mid-run
+_audit_tasks: set[asyncio.Task] = set()
+
+
+def _fire_and_forget(coro: Coroutine) -> None:
+    """Schedule a non-critical coroutine off the request's critical path.
+
+    Used for Reel audit logging: the log write happens concurrently with
+    response serialization instead of adding a DB round-trip to every
+    response. Failures are logged, never raised to the caller.
+    """
+    task = asyncio.create_task(coro)
+    _audit_tasks.add(task)
+
+    def _on_done(t: asyncio.Task) -> None:
+        _audit_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.error("Audit log task failed", exc_info=t.exception())
+
+    task.add_done_callback(_on_done)
+
+
+async def _write_audit_log(**log_kwargs) -> None:
+    """Write one Reel audit record on a dedicated session.
+
+    Detached audit tasks outlive the request, so they must not touch the
+    request-scoped AsyncSession: it forbids concurrent use and is torn
+    down when the response completes. Opening a session through the same
+    get_db dependency keeps the write on Matrix's pool without racing
+    the request's session.
+    """
+    try:
+        from src.modules.reel import get_reel_service
+    except ImportError:
+        return  # Reel not installed
+
+    async for session in get_db():
+        await get_reel_service(session).log(**log_kwargs)
+
 
 @router.get(
     "",
@@ -42,34 +85,55 @@ router = APIRouter()
 async def list_invitations(
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.view")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.view")),
     # Pagination
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    # Filters
-    status: Optional[InvitationStatus] = Query(None, description="Filter by status"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor from a previous page; takes precedence over page",
+    ),
+    # Filters ("status" stays a plain param name via alias so it does not
+    # shadow fastapi.status inside the handler)
+    status_filter: Optional[InvitationStatus] = Query(
+        None, alias="status", description="Filter by status"
+    ),
     email: Optional[str] = Query(None, max_length=255, description="Filter by email"),
     invited_by: Optional[UUID] = Query(None, description="Filter by inviter"),
     created_after: Optional[datetime] = Query(None, description="Filter by creation date"),
     created_before: Optional[datetime] = Query(None, description="Filter by creation date"),
-) -> InvitationList:
+) -> Response:
     """List invitations with filtering and pagination"""
-    service = InvitationService(db)
-
     filter_obj = InvitationFilter(
-        status=status,
+        status=status_filter,
         email=email,
         invited_by=invited_by,
         created_after=created_after,
         created_before=created_before,
     )
 
-    return await service.list(
-        tenant_id=tenant.tenant_id,
-        filter=filter_obj,
-        page=page,
-        page_size=page_size,
+    try:
+        result = await service.list(
+            tenant_id=tenant.tenant_id,
+            filter=filter_obj,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    # Serialize once in pydantic-core: one Rust-side pass emits the JSON
+    # bytes, skipping jsonable_encoder's Python-dict intermediate.
+    # exclude_none drops the mostly-null accepted_*/revoked_* fields from
+    # the payload; response_model above still documents the full shape.
+    return Response(
+        content=result.model_dump_json(exclude_none=True),
+        media_type="application/json",
     )
 
 
@@ -82,11 +146,10 @@ async def list_invitations(
 async def get_stats(
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.view")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.view")),
 ) -> InvitationStats:
     """Get invitation statistics for the tenant"""
-    service = InvitationService(db)
     return await service.get_stats(tenant.tenant_id)
 
 
@@ -100,12 +163,10 @@ async def get_invitation(
     invitation_id: UUID,
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.view")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.view")),
 ) -> InvitationRead:
     """Get a single invitation by ID"""
-    service = InvitationService(db)
-
     invitation = await service.get(invitation_id, tenant.tenant_id)
     if not invitation:
         raise HTTPException(
@@ -113,7 +174,7 @@ async def get_invitation(
             detail="Invitation not found",
         )
 
-    return InvitationRead.model_validate(invitation)
+    return InvitationRead.from_orm_fast(invitation)
 
 
 @router.post(
@@ -126,14 +187,13 @@ async def get_invitation(
 async def create_invitation(
     invitation_data: InvitationCreate,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.create")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.create")),
 ) -> InvitationRead:
     """Create a new invitation"""
-    service = InvitationService(db)
-
     try:
         invitation, raw_token = await service.create(
             email=invitation_data.email,
@@ -145,35 +205,32 @@ async def create_invitation(
             message=invitation_data.message,
         )
 
-        # Send invitation email
-        await service.send_invitation_email(
+        # Send invitation email after the response, so the request
+        # does not block on SMTP latency
+        background_tasks.add_task(
+            service.send_invitation_email,
             invitation=invitation,
             token=raw_token,
             tenant_name=tenant.tenant_name or "Your Organization",
             inviter_name=current_user.name,
         )
 
-        # Log to Reel
-        try:
-            from src.modules.reel import get_reel_service
-            reel = get_reel_service(db)
-            await reel.log(
-                module="aurora",
-                action="invitations.create",
-                tenant_id=tenant.tenant_id,
-                actor_id=current_user.id,
-                actor_email=current_user.email,
-                actor_name=current_user.name,
-                resource_type="invitation",
-                resource_id=invitation.id,
-                data={"email": invitation.email},
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-            )
-        except ImportError:
-            pass  # Reel not installed
-
-        return InvitationRead.model_validate(invitation)
+        # Log to Reel (on its own session, off the critical path)
+        _fire_and_forget(_write_audit_log(
+            module="aurora",
+            action="invitations.create",
+            tenant_id=tenant.tenant_id,
+            actor_id=current_user.id,
+            actor_email=current_user.email,
+            actor_name=current_user.name,
+            resource_type="invitation",
+            resource_id=invitation.id,
+            data={"email": invitation.email},
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+        ))
+
+        return InvitationRead.from_orm_fast(invitation)
 
     except ValueError as e:
         raise HTTPException(
@@ -191,48 +248,44 @@ async def create_invitation(
 async def resend_invitation(
     invitation_id: UUID,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.create")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.create")),
 ) -> InvitationResendResponse:
     """Resend invitation email"""
-    service = InvitationService(db)
-
     try:
         invitation, raw_token = await service.resend(invitation_id, tenant.tenant_id)
 
-        # Send email
-        email_sent = await service.send_invitation_email(
+        # Send email after the response, so the request does not
+        # block on SMTP latency
+        background_tasks.add_task(
+            service.send_invitation_email,
             invitation=invitation,
             token=raw_token,
             tenant_name=tenant.tenant_name or "Your Organization",
             inviter_name=current_user.name,
         )
 
-        # Log to Reel
-        try:
-            from src.modules.reel import get_reel_service
-            reel = get_reel_service(db)
-            await reel.log(
-                module="aurora",
-                action="invitations.resend",
-                tenant_id=tenant.tenant_id,
-                actor_id=current_user.id,
-                actor_email=current_user.email,
-                actor_name=current_user.name,
-                resource_type="invitation",
-                resource_id=invitation.id,
-                data={"email": invitation.email},
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-            )
-        except ImportError:
-            pass
+        # Log to Reel (on its own session, off the critical path)
+        _fire_and_forget(_write_audit_log(
+            module="aurora",
+            action="invitations.resend",
+            tenant_id=tenant.tenant_id,
+            actor_id=current_user.id,
+            actor_email=current_user.email,
+            actor_name=current_user.name,
+            resource_type="invitation",
+            resource_id=invitation.id,
+            data={"email": invitation.email},
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+        ))
 
         return InvitationResendResponse(
-            success=email_sent,
-            message="Invitation email resent" if email_sent else "Failed to send email",
+            success=True,
+            message="Invitation email queued",
         )
 
     except ValueError as e:
@@ -253,12 +306,10 @@ async def revoke_invitation(
     request: Request,
     current_user: CurrentUser,
     tenant: TenantContext,
-    db: Annotated[AsyncSession, Depends(get_db)],
-    _: None = Depends(require_permission("aurora.invitations.revoke")),
+    service: InvitationServiceDep,
+    _: None = Depends(require_permission_cached("aurora.invitations.revoke")),
 ) -> InvitationRevokeResponse:
     """Revoke a pending invitation"""
-    service = InvitationService(db)
-
     try:
         invitation = await service.revoke(
             invitation_id=invitation_id,
@@ -266,26 +317,21 @@ async def revoke_invitation(
             revoked_by=current_user.id,
         )
 
-        # Log to Reel
-        try:
-            from src.modules.reel import get_reel_service
-            reel = get_reel_service(db)
-            await reel.log(
-                module="aurora",
-                action="invitations.revoke",
-                tenant_id=tenant.tenant_id,
-                actor_id=current_user.id,
-                actor_email=current_user.email,
-                actor_name=current_user.name,
-                resource_type="invitation",
-                resource_id=invitation.id,
-                data={"email": invitation.email},
-                severity="WARNING",
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-            )
-        except ImportError:
-            pass
+        # Log to Reel (on its own session, off the critical path)
+        _fire_and_forget(_write_audit_log(
+            module="aurora",
+            action="invitations.revoke",
+            tenant_id=tenant.tenant_id,
+            actor_id=current_user.id,
+            actor_email=current_user.email,
+            actor_name=current_user.name,
+            resource_type="invitation",
+            resource_id=invitation.id,
+            data={"email": invitation.email},
+            severity="WARNING",
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+        ))
 
         return InvitationRevokeResponse(
             success=True,
@@ -309,6 +355,7 @@ async def accept_invitation(
     accept_data: InvitationAccept,
     request: Request,
     current_user: CurrentUser,
+    service: InvitationServiceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> InvitationAcceptResponse:
     """
@@ -319,8 +366,6 @@ async def accept_invitation(
     - User is assigned to specified clients
     - User is assigned specified role groups
     """
-    service = InvitationService(db)
-
     try:
         invitation = await service.accept(
             token=accept_data.token,
@@ -338,24 +383,45 @@ async def accept_invitation(
                 tenant_id=invitation.tenant_id,
             )
 
-            # Associate user with clients if specified
+            # Associate user with clients if specified. Prefer Mentor's
+            # bulk API (one multi-row INSERT) over one round-trip per id;
+            # fall back to the per-id calls on older Mentor versions.
             if invitation.client_ids:
-                for client_id in invitation.client_ids:
-                    await tenant_service.add_user_to_client(
+                add_clients_bulk = getattr(
+                    tenant_service, "add_user_to_clients_bulk", None
+                )
+                if add_clients_bulk is not None:
+                    await add_clients_bulk(
                         user_id=current_user.id,
-                        client_id=client_id,
+                        client_ids=invitation.client_ids,
                     )
-
-            # Assign role groups if specified
+                else:
+                    for client_id in invitation.client_ids:
+                        await tenant_service.add_user_to_client(
+                            user_id=current_user.id,
+                            client_id=client_id,
+                        )
+
+            # Assign role groups if specified (same bulk-first strategy)
             if invitation.role_group_ids:
                 from src.modules.mentor.services import RoleService
                 role_service = RoleService(db)
-                for role_group_id in invitation.role_group_ids:
-                    await role_service.assign_role_group_to_user(
+                assign_groups_bulk = getattr(
+                    role_service, "assign_role_groups_to_user_bulk", None
+                )
+                if assign_groups_bulk is not None:
+                    await assign_groups_bulk(
                         user_id=current_user.id,
-                        role_group_id=role_group_id,
+                        role_group_ids=invitation.role_group_ids,
                         tenant_id=invitation.tenant_id,
                     )
+                else:
+                    for role_group_id in invitation.role_group_ids:
+                        await role_service.assign_role_group_to_user(
+                            user_id=current_user.id,
+                            role_group_id=role_group_id,
+                            tenant_id=invitation.tenant_id,
+                        )
 
             tenant = await tenant_service.get(invitation.tenant_id)
             tenant_name = tenant.name if tenant else None
@@ -363,25 +429,20 @@ async def accept_invitation(
         except ImportError:
             tenant_name = None
 
-        # Log to Reel
-        try:
-            from src.modules.reel import get_reel_service
-            reel = get_reel_service(db)
-            await reel.log(
-                module="aurora",
-                action="invitations.accept",
-                tenant_id=invitation.tenant_id,
-                actor_id=current_user.id,
-                actor_email=current_user.email,
-                actor_name=current_user.name,
-                resource_type="invitation",
-                resource_id=invitation.id,
-                data={"email": invitation.email},
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-            )
-        except ImportError:
-            pass
+        # Log to Reel (on its own session, off the critical path)
+        _fire_and_forget(_write_audit_log(
+            module="aurora",
+            action="invitations.accept",
+            tenant_id=invitation.tenant_id,
+            actor_id=current_user.id,
+            actor_email=current_user.email,
+            actor_name=current_user.name,
+            resource_type="invitation",
+            resource_id=invitation.id,
+            data={"email": invitation.email},
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+        ))
 
         return InvitationAcceptResponse(
             success=True,
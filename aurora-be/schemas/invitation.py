@@ -1,10 +1,12 @@
 """Invitation schemas - Pydantic models for invitation API endpoints"""
 
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Optional, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing_extensions import TypedDict
 
 from ..models.invitation import InvitationStatus
 
@@ -35,8 +37,21 @@ class InvitationCreate(InvitationBase):
     )
 
 
-class InvitationRead(InvitationBase):
-    """Schema for reading an invitation"""
+class InvitationRead(BaseModel):
+    """Schema for reading an invitation.
+
+    Deliberately not derived from InvitationBase: read data comes from
+    the database, inside the trust boundary, so email is a plain str
+    (no email-validator pass) and the UUID arrays are Sequence-typed
+    rather than per-element-validated lists. Only inbound create data
+    pays for the strict types.
+    """
+
+    email: str
+    name: Optional[str] = None
+    client_ids: Optional[Sequence[UUID]] = None
+    role_group_ids: Optional[Sequence[UUID]] = None
+    message: Optional[str] = None
 
     id: UUID
     tenant_id: UUID
@@ -50,6 +65,23 @@ class InvitationRead(InvitationBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_orm_fast(cls, invitation) -> "InvitationRead":
+        """Build from a trusted ORM row, bypassing field validation.
+
+        Rows loaded from the database already satisfy the schema
+        constraints, so model_construct skips the per-field validator
+        chain — the dominant CPU cost when serializing large pages.
+        Untrusted input must keep going through model_validate.
+        """
+        return cls.model_construct(**dict(zip(_READ_FIELDS, _READ_GET(invitation))))
+
+
+# Bound once so from_orm_fast pulls every row attribute in a single
+# C-level attrgetter call instead of a Python getattr loop per field
+_READ_FIELDS = tuple(InvitationRead.model_fields)
+_READ_GET = attrgetter(*_READ_FIELDS)
+
 
 class InvitationList(BaseModel):
     """Paginated list of invitations"""
@@ -59,6 +91,9 @@ class InvitationList(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = Field(
+        None, description="Keyset cursor for the next page, if any"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -68,35 +103,32 @@ class InvitationList(BaseModel):
                 "page": 1,
                 "page_size": 50,
                 "pages": 1,
+                "next_cursor": None,
             }
         }
     )
 
 
-class InvitationFilter(BaseModel):
-    """Filter parameters for invitation queries"""
+class InvitationFilter(TypedDict, total=False):
+    """Filter parameters for invitation queries.
+
+    Internal-only: the router builds this from query params FastAPI has
+    already validated, so a TypedDict avoids paying for a second Pydantic
+    validation pass on every list call.
+    """
 
     # Status filter
-    status: Optional[InvitationStatus] = None
+    status: Optional[InvitationStatus]
 
     # Email search
-    email: Optional[str] = Field(None, max_length=255)
+    email: Optional[str]
 
     # Date range
-    created_after: Optional[datetime] = None
-    created_before: Optional[datetime] = None
+    created_after: Optional[datetime]
+    created_before: Optional[datetime]
 
     # Inviter filter
-    invited_by: Optional[UUID] = None
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "status": "PENDING",
-                "email": "john",
-            }
-        }
-    )
+    invited_by: Optional[UUID]
 
 
 class InvitationAccept(BaseModel):
@@ -165,8 +197,13 @@ class InvitationRevokeResponse(BaseModel):
     )
 
 
-class InvitationStats(BaseModel):
-    """Invitation statistics for a tenant"""
+class InvitationStats(TypedDict):
+    """Invitation statistics for a tenant.
+
+    Built server-side from trusted counts; a TypedDict skips Pydantic
+    model construction while FastAPI still documents and serializes it
+    through the response model.
+    """
 
     total: int
     pending: int
@@ -175,17 +212,3 @@ class InvitationStats(BaseModel):
     revoked: int
     sent_today: int
     sent_this_week: int
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "total": 100,
-                "pending": 10,
-                "accepted": 75,
-                "expired": 10,
-                "revoked": 5,
-                "sent_today": 3,
-                "sent_this_week": 15,
-            }
-        }
-    )
@@ -1,15 +1,31 @@
 """InvitationService - Core service for invitation management"""
 
+# Lazy annotations: inside the class body, names like "list" resolve to
+# the service's own methods, not the builtins, so evaluated annotations
+# such as list[tuple[...]] would crash at import
+from __future__ import annotations
+
+import asyncio
+import base64
 import hashlib
+import hmac
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from sqlalchemy import and_, bindparam, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Use Matrix infrastructure (Layer 0). Imported at module load so the
+# send paths pay no per-call module-dict lookup for these symbols.
+from src.providers.email import EmailMessage, get_email_provider
+
 from ..config import aurora_config
 from ..models.invitation import Invitation, InvitationStatus
 from ..schemas.invitation import (
@@ -22,6 +38,91 @@ from ..schemas.invitation import (
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import: hashlib.sha256 already dispatches to OpenSSL's
+# hardware-accelerated path, so for 32-byte tokens the remaining overhead
+# is the module attribute lookup per call
+_sha256 = hashlib.sha256
+
+# Email templates are parsed once at import; auto_reload=False keeps
+# renders from re-statting the files on every send
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATES_DIR),
+    autoescape=select_autoescape(("html",)),
+    cache_size=400,
+    auto_reload=False,
+)
+# Branding and expiry never vary between sends, so they are bound once
+# as template globals instead of being rebuilt into every render context
+_JINJA_ENV.globals.update(
+    expiry_days=aurora_config.invitation_expiry_days,
+    company_name=aurora_config.company_name,
+    support_email=aurora_config.support_email,
+    brand_primary_color=aurora_config.brand_primary_color,
+)
+_EMAIL_TMPL_TEXT = _JINJA_ENV.get_template("invitation_email.txt")
+_EMAIL_TMPL_HTML = _JINJA_ENV.get_template("invitation_email.html")
+
+# The accept link only varies by token; snapshot the base once instead
+# of re-reading settings and re-formatting the constant part per send
+_ACCEPT_URL_BASE = f"{aurora_config.app_url}/accept-invitation?token="
+
+
+def _encode_cursor(created_at: datetime, invitation_id: UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{invitation_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a keyset cursor back to (created_at, id).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_str, id_str = raw.split("|", 1)
+        return datetime.fromisoformat(created_str), UUID(id_str)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+# Invariant statement skeletons, built once at import. Re-executing the
+# same object skips per-call Core expression construction and guarantees
+# a hit in SQLAlchemy's compiled statement cache.
+_STMT_GET = select(Invitation).where(
+    and_(
+        Invitation.id == bindparam("invitation_id"),
+        Invitation.tenant_id == bindparam("tenant_id"),
+        Invitation.deleted_at.is_(None),
+    )
+)
+
+# Fallback for rows written before the token_prefix column existed: any
+# live row carrying a prefix is always found by the prefix probe first,
+# so the hash probe only needs to consider legacy NULL-prefix rows
+_STMT_GET_BY_TOKEN_LEGACY = select(Invitation).where(
+    and_(
+        Invitation.token_hash == bindparam("token_hash"),
+        Invitation.token_prefix.is_(None),
+        Invitation.deleted_at.is_(None),
+    )
+)
+
+_STMT_GET_BY_PREFIX = select(Invitation).where(
+    and_(
+        Invitation.token_prefix == bindparam("token_prefix"),
+        Invitation.deleted_at.is_(None),
+    )
+)
+
+# Column projection for list(): selecting plain columns skips ORM entity
+# materialization (identity map, instrumented attributes) for rows whose
+# only purpose is to become InvitationRead payloads
+_LIST_FIELDS = tuple(InvitationRead.model_fields)
+_LIST_COLS = tuple(getattr(Invitation, field) for field in _LIST_FIELDS)
+
 
 class InvitationService:
     """Service for managing user invitations"""
@@ -35,7 +136,6 @@ class InvitationService:
     def email_provider(self):
         """Lazy-load email provider from Matrix"""
         if self._email_provider is None:
-            from src.providers.email import get_email_provider
             self._email_provider = get_email_provider()
         return self._email_provider
 
@@ -43,9 +143,40 @@ class InvitationService:
         """Generate a cryptographically secure invitation token"""
         return secrets.token_urlsafe(aurora_config.token_length)
 
-    def hash_token(self, token: str) -> str:
-        """Hash token using SHA-256 for secure storage"""
-        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    def mint_token(self) -> tuple[str, bytes]:
+        """Generate a token and its stored digest in one pass.
+
+        A single urandom draw covers both outputs: the user-facing token
+        is the urlsafe-base64 form of the drawn bytes (byte-for-byte what
+        secrets.token_urlsafe produces) and the digest is computed on the
+        still-encoded bytes, skipping the str-decode/re-encode round-trip
+        that generate_token + hash_token pays. hash_token stays as the
+        counterpart for tokens presented back by users.
+
+        Returns:
+            Tuple of (raw_token, token_hash)
+        """
+        encoded = base64.urlsafe_b64encode(
+            secrets.token_bytes(aurora_config.token_length)
+        ).rstrip(b"=")
+        return encoded.decode("ascii"), _sha256(encoded).digest()
+
+    def hash_token(self, token: str) -> bytes:
+        """Hash token using SHA-256 for secure storage.
+
+        A single unsalted SHA-256 is deliberate: tokens already carry
+        >256 bits of entropy from token_urlsafe, so salted/iterated KDFs
+        (bcrypt, PBKDF2) add milliseconds of cost per create/accept/resend
+        without any security benefit. This matches how Guardian hashes its
+        own tokens. hashlib.sha256 goes through OpenSSL, which dispatches
+        to the SHA-NI instructions where the CPU has them, so for a
+        <100-byte token the digest is already sub-microsecond; faster
+        digests (e.g. blake3) would save nothing measurable while
+        invalidating every stored hash and adding a native dependency.
+
+        Returns the raw 32-byte digest matching the BYTEA token_hash column.
+        """
+        return _sha256(token.encode("utf-8")).digest()
 
     async def create(
         self,
@@ -61,81 +192,166 @@ class InvitationService:
         """
         Create a new invitation.
 
+        Duplicate prevention is delegated to the partial unique index
+        (idx_aurora_unique_pending): a single INSERT ... ON CONFLICT
+        DO NOTHING replaces the old SELECT pre-check + INSERT pair,
+        saving a round-trip and closing the check-then-insert race.
+
         Returns:
             Tuple of (invitation, raw_token)
-        """
-        # Check for existing pending invitation
-        existing = await self._get_pending_by_email(email, tenant_id)
-        if existing:
-            raise ValueError(f"Pending invitation already exists for {email}")
 
+        Raises:
+            ValueError: If a pending invitation already exists for the email
+        """
         # Generate token
-        raw_token = self.generate_token()
-        token_hash = self.hash_token(raw_token)
+        raw_token, token_hash = self.mint_token()
 
         # Calculate expiry
         expires_at = datetime.now(timezone.utc) + timedelta(
             days=aurora_config.invitation_expiry_days
         )
 
-        invitation = Invitation(
-            email=email.lower(),
-            name=name,
-            tenant_id=tenant_id,
-            client_ids=client_ids,
-            role_group_ids=role_group_ids,
-            status=InvitationStatus.PENDING,
-            invited_by=invited_by,
-            token_hash=token_hash,
-            expires_at=expires_at,
-            message=message,
+        stmt = (
+            pg_insert(Invitation)
+            .values(
+                email=email.lower(),
+                name=name,
+                tenant_id=tenant_id,
+                client_ids=client_ids,
+                role_group_ids=role_group_ids,
+                status=InvitationStatus.PENDING,
+                invited_by=invited_by,
+                token_hash=token_hash,
+                token_prefix=raw_token[:8],
+                expires_at=expires_at,
+                message=message,
+            )
+            .on_conflict_do_nothing(
+                index_elements=["tenant_id", "email"],
+                index_where=text("status = 'PENDING' AND deleted_at IS NULL"),
+            )
+            .returning(Invitation)
         )
 
-        self.db.add(invitation)
-        await self.db.commit()
-        await self.db.refresh(invitation)
+        result = await self.db.execute(stmt)
+        invitation = result.scalars().first()
 
+        if invitation is None:
+            raise ValueError(f"Pending invitation already exists for {email}")
+
+        await self.db.commit()
         return invitation, raw_token
 
+    async def bulk_create(
+        self,
+        *,
+        emails: list[str],
+        tenant_id: UUID,
+        invited_by: UUID,
+        client_ids: Optional[list[UUID]] = None,
+        role_group_ids: Optional[list[UUID]] = None,
+        message: Optional[str] = None,
+    ) -> list[tuple[Invitation, str]]:
+        """
+        Create invitations for many emails in a single statement.
+
+        Tokens are generated and hashed in a tight local loop (hashlib
+        already runs OpenSSL's hardware SHA-256), then all rows ship to
+        Postgres as one multi-row INSERT ... ON CONFLICT DO NOTHING, so
+        the cost per invitation is dominated by the token generation
+        rather than per-row round-trips. Emails that already have a
+        pending invitation are skipped, mirroring create().
+
+        Returns:
+            List of (invitation, raw_token) for the rows actually created
+        """
+        if not emails:
+            return []
+
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            days=aurora_config.invitation_expiry_days
+        )
+
+        # De-duplicate within the batch: ON CONFLICT cannot arbitrate
+        # two rows for the same key inside one INSERT
+        rows = []
+        tokens_by_email: dict[str, str] = {}
+        for email in emails:
+            normalized = email.lower()
+            if normalized in tokens_by_email:
+                continue
+            raw_token, token_hash = self.mint_token()
+            tokens_by_email[normalized] = raw_token
+            rows.append(
+                {
+                    "email": normalized,
+                    "tenant_id": tenant_id,
+                    "client_ids": client_ids,
+                    "role_group_ids": role_group_ids,
+                    "status": InvitationStatus.PENDING,
+                    "invited_by": invited_by,
+                    "token_hash": token_hash,
+                    "token_prefix": raw_token[:8],
+                    "expires_at": expires_at,
+                    "message": message,
+                }
+            )
+
+        stmt = (
+            pg_insert(Invitation)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=["tenant_id", "email"],
+                index_where=text("status = 'PENDING' AND deleted_at IS NULL"),
+            )
+            .returning(Invitation)
+        )
+
+        result = await self.db.execute(stmt)
+        invitations = result.scalars().all()
+        await self.db.commit()
+
+        return [(inv, tokens_by_email[inv.email]) for inv in invitations]
+
     async def get(self, invitation_id: UUID, tenant_id: UUID) -> Optional[Invitation]:
         """Get an invitation by ID (scoped to tenant)"""
         result = await self.db.execute(
-            select(Invitation).where(
-                and_(
-                    Invitation.id == invitation_id,
-                    Invitation.tenant_id == tenant_id,
-                    Invitation.deleted_at.is_(None),
-                )
-            )
+            _STMT_GET,
+            {"invitation_id": invitation_id, "tenant_id": tenant_id},
         )
         return result.scalar_one_or_none()
 
     async def get_by_token(self, token: str) -> Optional[Invitation]:
-        """Get an invitation by raw token"""
-        token_hash = self.hash_token(token)
+        """Get an invitation by raw token.
+
+        This is accept()'s diagnostic path — the acceptance UPDATE
+        matches token_hash directly — so it runs only after an
+        acceptance attempt failed, never on the hot path. The indexed
+        8-char prefix narrows verification to a handful of candidates,
+        compared in constant time. Rows written before the prefix column
+        existed carry a NULL prefix and are resolved through the hash
+        index; until they rotate out, an unknown token costs the digest
+        plus that second probe.
+        """
+        if len(token) < 8:
+            return None
+
         result = await self.db.execute(
-            select(Invitation).where(
-                and_(
-                    Invitation.token_hash == token_hash,
-                    Invitation.deleted_at.is_(None),
-                )
-            )
+            _STMT_GET_BY_PREFIX,
+            {"token_prefix": token[:8]},
         )
-        return result.scalar_one_or_none()
+        candidates = result.scalars().all()
 
-    async def _get_pending_by_email(
-        self, email: str, tenant_id: UUID
-    ) -> Optional[Invitation]:
-        """Get pending invitation for email in tenant"""
+        token_hash = self.hash_token(token)
+        for invitation in candidates:
+            if hmac.compare_digest(invitation.token_hash, token_hash):
+                return invitation
+
+        # Any live row with this token's prefix was in candidates above,
+        # so the hash probe is restricted to legacy NULL-prefix rows
         result = await self.db.execute(
-            select(Invitation).where(
-                and_(
-                    Invitation.email == email.lower(),
-                    Invitation.tenant_id == tenant_id,
-                    Invitation.status == InvitationStatus.PENDING,
-                    Invitation.deleted_at.is_(None),
-                )
-            )
+            _STMT_GET_BY_TOKEN_LEGACY,
+            {"token_hash": token_hash},
         )
         return result.scalar_one_or_none()
 
@@ -145,13 +361,25 @@ class InvitationService:
         filter: Optional[InvitationFilter] = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[str] = None,
     ) -> InvitationList:
-        """List invitations with filtering and pagination"""
+        """List invitations with filtering and pagination.
+
+        When a cursor is given, keyset (seek) pagination on
+        (created_at, id) is used: an index-range scan whose cost stays
+        O(page_size) at any depth, unlike OFFSET which scans and discards
+        all preceding rows. Every page includes a next_cursor for the
+        following one. The page/offset path remains for callers that need
+        numbered pages.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
         page_size = min(page_size, aurora_config.max_page_size)
         page = max(page, 1)
 
-        # Base query
-        query = select(Invitation).where(
+        # Base query: a pure column projection, no ORM entities
+        query = select(*_LIST_COLS).where(
             and_(
                 Invitation.tenant_id == tenant_id,
                 Invitation.deleted_at.is_(None),
@@ -162,51 +390,95 @@ class InvitationService:
         if filter:
             query = self._apply_filters(query, filter)
 
-        # Order by created_at DESC
-        query = query.order_by(Invitation.created_at.desc())
+        # Ride the total along as a COUNT(*) OVER () column: the window
+        # is evaluated before LIMIT/OFFSET, so one query returns both the
+        # page and the filtered total instead of a separate count query.
+        # On the cursor path the total covers the rows from the cursor
+        # position onward, which is what a seek client can still consume.
+        query = query.add_columns(func.count().over().label("total"))
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        # Order by created_at DESC with id as a stable tiebreaker
+        query = query.order_by(
+            Invitation.created_at.desc(), Invitation.id.desc()
+        )
 
         # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        if cursor is not None:
+            cursor_created, cursor_id = _decode_cursor(cursor)
+            query = query.where(
+                tuple_(Invitation.created_at, Invitation.id)
+                < (cursor_created, cursor_id)
+            )
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size)
 
         # Execute
         result = await self.db.execute(query)
-        invitations = result.scalars().all()
+        rows = result.all()
+
+        if rows:
+            total = rows[0].total
+        elif page > 1 and cursor is None:
+            # Offset overshot the set: fall back to a plain count so the
+            # client still learns the real total
+            count_query = select(func.count()).where(
+                and_(
+                    Invitation.tenant_id == tenant_id,
+                    Invitation.deleted_at.is_(None),
+                )
+            )
+            if filter:
+                count_query = self._apply_filters(count_query, filter)
+            count_result = await self.db.execute(count_query)
+            total = count_result.scalar() or 0
+        else:
+            total = 0
 
         # Calculate pages
         pages = (total + page_size - 1) // page_size if total > 0 else 0
 
+        # Hand out a cursor whenever the page is full; a final empty
+        # page just means the set ended on a page boundary
+        next_cursor = None
+        if len(rows) == page_size:
+            last = rows[-1]
+            next_cursor = _encode_cursor(last.created_at, last.id)
+
+        # zip stops at _LIST_FIELDS, so the trailing window total column
+        # never leaks into the payload
+        items = [
+            InvitationRead.model_construct(**dict(zip(_LIST_FIELDS, row)))
+            for row in rows
+        ]
+
         return InvitationList(
-            items=[InvitationRead.model_validate(i) for i in invitations],
+            items=items,
             total=total,
             page=page,
             page_size=page_size,
             pages=pages,
+            next_cursor=next_cursor,
         )
 
     def _apply_filters(self, query, filter: InvitationFilter):
         """Apply filter conditions to query"""
         conditions = []
 
-        if filter.status:
-            conditions.append(Invitation.status == filter.status)
+        if filter.get("status"):
+            conditions.append(Invitation.status == filter["status"])
 
-        if filter.email:
-            conditions.append(Invitation.email.ilike(f"%{filter.email}%"))
+        if filter.get("email"):
+            conditions.append(Invitation.email.ilike(f"%{filter['email']}%"))
 
-        if filter.created_after:
-            conditions.append(Invitation.created_at >= filter.created_after)
+        if filter.get("created_after"):
+            conditions.append(Invitation.created_at >= filter["created_after"])
 
-        if filter.created_before:
-            conditions.append(Invitation.created_at <= filter.created_before)
+        if filter.get("created_before"):
+            conditions.append(Invitation.created_at <= filter["created_before"])
 
-        if filter.invited_by:
-            conditions.append(Invitation.invited_by == filter.invited_by)
+        if filter.get("invited_by"):
+            conditions.append(Invitation.invited_by == filter["invited_by"])
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -221,6 +493,12 @@ class InvitationService:
         """
         Accept an invitation.
 
+        Status, expiry, and liveness are all evaluated inside the WHERE
+        clause of one UPDATE ... RETURNING, so the happy path costs a
+        single round-trip and concurrent acceptances of the same token
+        cannot both succeed; the extra SELECT happens only on failure, to
+        pick the precise error.
+
         Args:
             token: Raw invitation token
             user_id: ID of the user accepting the invitation
@@ -231,6 +509,36 @@ class InvitationService:
         Raises:
             ValueError: If invitation is invalid, expired, or already used
         """
+        token_hash = self.hash_token(token)
+
+        # Single atomic UPDATE: validation happens in the WHERE clause, so
+        # the happy path is one round-trip and two concurrent acceptances
+        # cannot both succeed
+        stmt = (
+            update(Invitation)
+            .where(
+                and_(
+                    Invitation.token_hash == token_hash,
+                    Invitation.status == InvitationStatus.PENDING,
+                    Invitation.expires_at > func.now(),
+                    Invitation.deleted_at.is_(None),
+                )
+            )
+            .values(status=InvitationStatus.ACCEPTED, accepted_at=func.now())
+            .returning(Invitation)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.db.execute(stmt)
+        invitation = result.scalars().first()
+
+        if invitation is not None:
+            await self.db.commit()
+            # User associations via Mentor are created by the router
+            # after the service call
+            return invitation
+
+        # Miss path (rare): fetch once to report a precise error
         invitation = await self.get_by_token(token)
 
         if not invitation:
@@ -239,23 +547,10 @@ class InvitationService:
         if invitation.status != InvitationStatus.PENDING:
             raise ValueError(f"Invitation is {invitation.status.value.lower()}")
 
-        if invitation.expires_at < datetime.now(timezone.utc):
-            # Mark as expired
-            invitation.status = InvitationStatus.EXPIRED
-            await self.db.commit()
-            raise ValueError("Invitation has expired")
-
-        # Accept the invitation
-        invitation.status = InvitationStatus.ACCEPTED
-        invitation.accepted_at = datetime.now(timezone.utc)
-
+        # Still pending, so the UPDATE missed on expiry: mark as expired
+        invitation.status = InvitationStatus.EXPIRED
         await self.db.commit()
-        await self.db.refresh(invitation)
-
-        # TODO: Create user associations via Mentor
-        # This would be done in the router after the service call
-
-        return invitation
+        raise ValueError("Invitation has expired")
 
     async def revoke(
         self,
@@ -263,23 +558,40 @@ class InvitationService:
         tenant_id: UUID,
         revoked_by: UUID,
     ) -> Invitation:
-        """Revoke a pending invitation"""
-        invitation = await self.get(invitation_id, tenant_id)
+        """Revoke a pending invitation with a single atomic UPDATE"""
+        stmt = (
+            update(Invitation)
+            .where(
+                and_(
+                    Invitation.id == invitation_id,
+                    Invitation.tenant_id == tenant_id,
+                    Invitation.status == InvitationStatus.PENDING,
+                    Invitation.deleted_at.is_(None),
+                )
+            )
+            .values(
+                status=InvitationStatus.REVOKED,
+                revoked_at=func.now(),
+                revoked_by=revoked_by,
+            )
+            .returning(Invitation)
+            .execution_options(synchronize_session=False)
+        )
 
-        if not invitation:
-            raise ValueError("Invitation not found")
+        result = await self.db.execute(stmt)
+        invitation = result.scalars().first()
 
-        if invitation.status != InvitationStatus.PENDING:
-            raise ValueError(f"Cannot revoke {invitation.status.value.lower()} invitation")
+        if invitation is not None:
+            await self.db.commit()
+            return invitation
 
-        invitation.status = InvitationStatus.REVOKED
-        invitation.revoked_at = datetime.now(timezone.utc)
-        invitation.revoked_by = revoked_by
+        # Miss path (rare): fetch once to report a precise error
+        invitation = await self.get(invitation_id, tenant_id)
 
-        await self.db.commit()
-        await self.db.refresh(invitation)
+        if not invitation:
+            raise ValueError("Invitation not found")
 
-        return invitation
+        raise ValueError(f"Cannot revoke {invitation.status.value.lower()} invitation")
 
     async def resend(
         self,
@@ -289,31 +601,77 @@ class InvitationService:
         """
         Resend an invitation with a new token.
 
+        Token rotation is a single atomic UPDATE ... RETURNING, matching
+        accept/revoke: validation lives in the WHERE clause, so the happy
+        path is one round-trip instead of SELECT + UPDATE + refresh.
+
         Returns:
             Tuple of (invitation, new_raw_token)
         """
+        raw_token, token_hash = self.mint_token()
+
+        stmt = (
+            update(Invitation)
+            .where(
+                and_(
+                    Invitation.id == invitation_id,
+                    Invitation.tenant_id == tenant_id,
+                    Invitation.status == InvitationStatus.PENDING,
+                    Invitation.deleted_at.is_(None),
+                )
+            )
+            .values(
+                token_hash=token_hash,
+                token_prefix=raw_token[:8],
+                expires_at=datetime.now(timezone.utc)
+                + timedelta(days=aurora_config.invitation_expiry_days),
+            )
+            .returning(Invitation)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.db.execute(stmt)
+        invitation = result.scalars().first()
+
+        if invitation is not None:
+            await self.db.commit()
+            return invitation, raw_token
+
+        # Miss path (rare): fetch once to report a precise error
         invitation = await self.get(invitation_id, tenant_id)
 
         if not invitation:
             raise ValueError("Invitation not found")
 
-        if invitation.status != InvitationStatus.PENDING:
-            raise ValueError(f"Cannot resend {invitation.status.value.lower()} invitation")
-
-        # Generate new token
-        raw_token = self.generate_token()
-        invitation.token_hash = self.hash_token(raw_token)
+        raise ValueError(f"Cannot resend {invitation.status.value.lower()} invitation")
 
-        # Reset expiry
-        invitation.expires_at = datetime.now(timezone.utc) + timedelta(
-            days=aurora_config.invitation_expiry_days
+    def _build_email_message(
+        self,
+        invitation: Invitation,
+        token: str,
+        tenant_name: str,
+        inviter_name: Optional[str] = None,
+    ):
+        """Render the invitation email for a single recipient"""
+        accept_url = _ACCEPT_URL_BASE + token
+
+        # Static branding comes in via _JINJA_ENV.globals; only the
+        # per-invitation values travel in the context
+        context = {
+            "name": invitation.name,
+            "inviter_name": inviter_name,
+            "tenant_name": tenant_name,
+            "message": invitation.message,
+            "accept_url": accept_url,
+        }
+
+        return EmailMessage(
+            to=[invitation.email],
+            subject=f"You've been invited to join {tenant_name}",
+            body=_EMAIL_TMPL_TEXT.render(context),
+            html=_EMAIL_TMPL_HTML.render(context),
         )
 
-        await self.db.commit()
-        await self.db.refresh(invitation)
-
-        return invitation, raw_token
-
     async def send_invitation_email(
         self,
         invitation: Invitation,
@@ -322,81 +680,8 @@ class InvitationService:
         inviter_name: Optional[str] = None,
     ) -> bool:
         """Send invitation email"""
-        from src.providers.email import EmailMessage
-
-        config = aurora_config
-        accept_url = f"{config.app_url}/accept-invitation?token={token}"
-
-        inviter_text = f" by {inviter_name}" if inviter_name else ""
-        message_text = f"\n\n{invitation.message}" if invitation.message else ""
-
-        subject = f"You've been invited to join {tenant_name}"
-
-        body = f"""Hello{' ' + invitation.name if invitation.name else ''},
-
-You've been invited{inviter_text} to join {tenant_name}.{message_text}
-
-Click the link below to accept your invitation:
-{accept_url}
-
-This invitation will expire in {config.invitation_expiry_days} days.
-
-If you did not expect this invitation, please ignore this email.
-
---
-{config.company_name}
-"""
-
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-</head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px;">
-    <div style="max-width: 500px; margin: 0 auto;">
-        <h2 style="color: #333; margin-bottom: 20px;">You're Invited!</h2>
-
-        <p style="color: #666; font-size: 16px; line-height: 1.5;">
-            Hello{' ' + invitation.name if invitation.name else ''},
-        </p>
-
-        <p style="color: #666; font-size: 16px; line-height: 1.5;">
-            You've been invited{inviter_text} to join <strong>{tenant_name}</strong>.
-        </p>
-
-        {f'<p style="color: #666; font-size: 16px; line-height: 1.5; background: #f5f5f5; padding: 15px; border-radius: 8px; font-style: italic;">"{invitation.message}"</p>' if invitation.message else ''}
-
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="{accept_url}" style="background: {config.brand_primary_color}; color: white; padding: 15px 30px; text-decoration: none; border-radius: 8px; font-weight: bold; display: inline-block;">
-                Accept Invitation
-            </a>
-        </div>
-
-        <p style="color: #999; font-size: 14px;">
-            This invitation will expire in <strong>{config.invitation_expiry_days} days</strong>.
-        </p>
-
-        <p style="color: #999; font-size: 12px; margin-top: 30px;">
-            If you did not expect this invitation, please ignore this email.
-        </p>
-
-        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-
-        <p style="color: #999; font-size: 12px;">
-            {config.company_name}<br>
-            <a href="mailto:{config.support_email}" style="color: {config.brand_primary_color};">{config.support_email}</a>
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-        email_message = EmailMessage(
-            to=[invitation.email],
-            subject=subject,
-            body=body,
-            html=html,
+        email_message = self._build_email_message(
+            invitation, token, tenant_name, inviter_name
         )
 
         try:
@@ -411,81 +696,134 @@ If you did not expect this invitation, please ignore this email.
             logger.error(f"Invitation email error: {e}", exc_info=True)
             return False
 
+    async def send_many(
+        self,
+        items: list[tuple[Invitation, str]],
+        tenant_name: str,
+        inviter_name: Optional[str] = None,
+    ) -> int:
+        """Send invitation emails for a batch of (invitation, token) pairs.
+
+        Messages are rendered in one tight loop and then dispatched in a
+        single provider send_batch call when the deployed Matrix provider
+        has one; otherwise the individual sends run concurrently under
+        asyncio.gather, so the transport round-trips overlap instead of
+        serializing. Failures are logged per recipient and never abort
+        the rest of the batch.
+
+        Returns:
+            Number of emails accepted by the provider
+        """
+        if not items:
+            return 0
+
+        messages = [
+            self._build_email_message(invitation, token, tenant_name, inviter_name)
+            for invitation, token in items
+        ]
+
+        provider = self.email_provider
+        send_batch = getattr(provider, "send_batch", None)
+
+        try:
+            if send_batch is not None:
+                results = await send_batch(messages)
+            else:
+                results = await asyncio.gather(
+                    *(provider.send(message) for message in messages),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            logger.error(f"Bulk invitation email error: {e}", exc_info=True)
+            return 0
+
+        sent = 0
+        for message, result in zip(messages, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Invitation email error for {message.to[0]}: {result}"
+                )
+            elif getattr(result, "success", True):
+                sent += 1
+            else:
+                logger.error(f"Failed to send invitation email: {result.error}")
+        return sent
+
     async def get_stats(self, tenant_id: UUID) -> InvitationStats:
-        """Get invitation statistics for a tenant"""
+        """Get invitation statistics for a tenant.
+
+        All seven counters come from one aggregate query using Postgres
+        FILTER clauses, so the table is scanned once instead of once per
+        counter and the endpoint costs a single round-trip.
+        """
         now = datetime.now(timezone.utc)
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         week_start = today_start - timedelta(days=now.weekday())
 
-        base_filter = and_(
-            Invitation.tenant_id == tenant_id,
-            Invitation.deleted_at.is_(None),
-        )
-
-        # Total
-        total_result = await self.db.execute(
-            select(func.count()).where(base_filter)
-        )
-        total = total_result.scalar() or 0
-
-        # By status
-        status_result = await self.db.execute(
-            select(Invitation.status, func.count())
-            .where(base_filter)
-            .group_by(Invitation.status)
-        )
-        status_counts = {row[0].value: row[1] for row in status_result.all()}
+        def _status_count(status: InvitationStatus):
+            return func.count().filter(Invitation.status == status)
 
-        # Sent today
-        today_result = await self.db.execute(
-            select(func.count()).where(
-                and_(base_filter, Invitation.created_at >= today_start)
-            )
-        )
-        sent_today = today_result.scalar() or 0
-
-        # Sent this week
-        week_result = await self.db.execute(
-            select(func.count()).where(
-                and_(base_filter, Invitation.created_at >= week_start)
+        result = await self.db.execute(
+            select(
+                func.count().label("total"),
+                _status_count(InvitationStatus.PENDING).label("pending"),
+                _status_count(InvitationStatus.ACCEPTED).label("accepted"),
+                _status_count(InvitationStatus.EXPIRED).label("expired"),
+                _status_count(InvitationStatus.REVOKED).label("revoked"),
+                func.count()
+                .filter(Invitation.created_at >= today_start)
+                .label("sent_today"),
+                func.count()
+                .filter(Invitation.created_at >= week_start)
+                .label("sent_this_week"),
+            ).where(
+                and_(
+                    Invitation.tenant_id == tenant_id,
+                    Invitation.deleted_at.is_(None),
+                )
             )
         )
-        sent_this_week = week_result.scalar() or 0
+        row = result.one()
 
         return InvitationStats(
-            total=total,
-            pending=status_counts.get("PENDING", 0),
-            accepted=status_counts.get("ACCEPTED", 0),
-            expired=status_counts.get("EXPIRED", 0),
-            revoked=status_counts.get("REVOKED", 0),
-            sent_today=sent_today,
-            sent_this_week=sent_this_week,
+            total=row.total,
+            pending=row.pending,
+            accepted=row.accepted,
+            expired=row.expired,
+            revoked=row.revoked,
+            sent_today=row.sent_today,
+            sent_this_week=row.sent_this_week,
         )
 
     async def expire_old_invitations(self) -> int:
-        """Mark expired invitations as EXPIRED. Returns count of updated."""
-        now = datetime.now(timezone.utc)
+        """Mark expired invitations as EXPIRED. Returns count of updated.
 
+        One set-based UPDATE instead of loading every stale row into the
+        session and dirtying it individually: the database flips all rows
+        in a single statement regardless of how many have lapsed.
+        """
         result = await self.db.execute(
-            select(Invitation).where(
+            update(Invitation)
+            .where(
                 and_(
                     Invitation.status == InvitationStatus.PENDING,
-                    Invitation.expires_at < now,
+                    Invitation.expires_at < func.now(),
                     Invitation.deleted_at.is_(None),
                 )
             )
+            .values(status=InvitationStatus.EXPIRED)
+            .execution_options(synchronize_session=False)
         )
-        invitations = result.scalars().all()
-
-        for invitation in invitations:
-            invitation.status = InvitationStatus.EXPIRED
-
-        if invitations:
-            await self.db.commit()
+        await self.db.commit()
 
-        return len(invitations)
+        return result.rowcount
 
 
 def get_invitation_service(db: AsyncSession) -> InvitationService:
-    """Factory function for InvitationService (FastAPI dependency)"""
+    """Factory function for InvitationService (FastAPI dependency).
+
+    The session's engine and connection pool are owned by Matrix
+    (src.database); Aurora assumes it is pooled. See "Connection
+    Pooling" in the README for the sizing Matrix is expected to use.
+    """
     return InvitationService(db)
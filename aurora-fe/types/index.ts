@@ -13,18 +13,18 @@ export type InvitationStatus = 'PENDING' | 'ACCEPTED' | 'EXPIRED' | 'REVOKED'
 export interface Invitation {
   id: string
   email: string
-  name: string | null
+  name?: string | null
   tenant_id: string
-  client_ids: string[] | null
-  role_group_ids: string[] | null
+  client_ids?: string[] | null
+  role_group_ids?: string[] | null
   status: InvitationStatus
   invited_by: string
   created_at: string
   expires_at: string
-  accepted_at: string | null
-  revoked_at: string | null
-  revoked_by: string | null
-  message: string | null
+  accepted_at?: string | null
+  revoked_at?: string | null
+  revoked_by?: string | null
+  message?: string | null
 }
 
 /**
@@ -58,6 +58,7 @@ export interface InvitationList {
   page: number
   page_size: number
   pages: number
+  next_cursor?: string | null
 }
 
 /**
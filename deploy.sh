@@ -106,6 +106,18 @@ if [ -d "$SCRIPT_DIR/aurora-be" ]; then
         echo "  ✓ Actions deployed"
     fi
 
+    # Deploy _fast_uuid.py
+    if [ -f "_fast_uuid.py" ]; then
+        cp _fast_uuid.py "$BE_SLOT/_fast_uuid.py"
+        echo "  ✓ Fast UUID helper deployed"
+    fi
+
+    # Deploy permissions.py
+    if [ -f "permissions.py" ]; then
+        cp permissions.py "$BE_SLOT/permissions.py"
+        echo "  ✓ Permissions deployed"
+    fi
+
     # Deploy routers directory
     if [ -d "routers" ]; then
         mkdir -p "$BE_SLOT/routers"
@@ -134,6 +146,13 @@ if [ -d "$SCRIPT_DIR/aurora-be" ]; then
         echo "  ✓ Services deployed"
     fi
 
+    # Deploy email templates
+    if [ -d "templates" ]; then
+        mkdir -p "$BE_SLOT/templates"
+        cp -r templates/* "$BE_SLOT/templates/"
+        echo "  ✓ Templates deployed"
+    fi
+
     # Deploy alembic migrations
     if [ -d "alembic/versions" ]; then
         mkdir -p "$BE_TARGET/alembic/versions"